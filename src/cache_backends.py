@@ -0,0 +1,652 @@
+"""Cache storage backends."""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import hashlib
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generic, Hashable, NamedTuple, TYPE_CHECKING, TypeVar, Union
+from urllib.parse import urlsplit
+
+from src.locks import file_lock
+from src.metrics import Histogram
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+    from src.configurations import Config
+
+
+logger = logging.getLogger(__name__)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+RedisReply = Union[bytes, int, None, list]
+
+
+class CacheBackendError(Exception):
+    """Cache storage is unavailable or returned an error."""
+
+
+class CacheEntry(NamedTuple):
+    """Cached value with version of the data it was built from."""
+
+    version: int
+    value: bytes
+    expires_at: float = 0
+
+
+def pack_entry(version: int, value: bytes, expires_at: float = 0) -> bytes:
+    """Serialize cache entry as header line with version and expiration time in milliseconds followed by value."""
+    return b"%d %d\n" % (version, expires_at * 1000) + value
+
+
+def unpack_entry(data: bytes) -> CacheEntry:
+    """Deserialize cache entry, data without header line has version zero and does not expire."""
+    header, separator, value = data.partition(b"\n")
+    version, _, expires_at = header.partition(b" ")
+    if not separator or not version.isdigit() or not (expires_at or b"0").isdigit():
+        return CacheEntry(version=0, value=data)
+    return CacheEntry(version=int(version), value=value, expires_at=int(expires_at or 0) / 1000)
+
+
+class SweepReport(NamedTuple):
+    """Result of cache sweep."""
+
+    files: int
+    bytes: int
+
+
+class CacheStats:
+    """Thread-safe hit, miss and latency counters of cache backend."""
+
+    def __init__(self) -> None:
+        """Init zero counters."""
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.errors = 0
+        self.get_latency = Histogram()
+        self.set_latency = Histogram()
+        self.delete_latency = Histogram()
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str) -> None:
+        """Increment counter by name."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get current counters."""
+        with self._lock:
+            hits, misses, sets, deletes, errors = self.hits, self.misses, self.sets, self.deletes, self.errors
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "sets": sets,
+            "deletes": deletes,
+            "errors": errors,
+            "get_latency": self.get_latency.snapshot(),
+            "set_latency": self.set_latency.snapshot(),
+            "delete_latency": self.delete_latency.snapshot(),
+        }
+
+
+class CacheBackend(abc.ABC):
+    """Key-value storage for serialized cache entries.
+
+    Public methods count hits, misses and latencies for every backend the same way.
+    Storage errors are logged and treated as misses, so an unavailable cache
+    degrades to database reads instead of failing requests.
+
+    Entries are versioned: a write never replaces a not expired entry with
+    a greater version, so a stale read racing with an update cannot overwrite it.
+    Entries may have own TTL shorter than the backend one.
+    """
+
+    name: str
+
+    def __init__(self, ttl: float) -> None:
+        """Init backend with entries time to live in seconds, zero disables expiration."""
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get entry by key."""
+        started_at = time.perf_counter()
+        try:
+            data = self._get(key)
+        except (CacheBackendError, OSError, sqlite3.Error):
+            logger.warning("Cache backend %s get failed.", self.name, exc_info=True)
+            self.stats.increment("errors")
+            data = None
+        self.stats.get_latency.observe(time.perf_counter() - started_at)
+        entry = None if data is None else unpack_entry(data)
+        if entry is not None and entry.expires_at and entry.expires_at <= time.time():
+            entry = None
+        self.stats.increment("misses" if entry is None else "hits")
+        return entry
+
+    def set(self, key: str, value: bytes, version: int = 0, ttl: float | None = None) -> None:
+        """Set value by key unless stored entry has greater version."""
+        ttl = self.ttl if ttl is None else ttl
+        started_at = time.perf_counter()
+        try:
+            self._set(key, pack_entry(version, value, time.time() + ttl if ttl else 0), version, ttl)
+        except (CacheBackendError, OSError, sqlite3.Error):
+            logger.warning("Cache backend %s set failed.", self.name, exc_info=True)
+            self.stats.increment("errors")
+        self.stats.set_latency.observe(time.perf_counter() - started_at)
+        self.stats.increment("sets")
+
+    def delete(self, key: str) -> None:
+        """Delete value by key."""
+        started_at = time.perf_counter()
+        try:
+            self._delete(key)
+        except (CacheBackendError, OSError, sqlite3.Error):
+            logger.warning("Cache backend %s delete failed.", self.name, exc_info=True)
+            self.stats.increment("errors")
+        self.stats.delete_latency.observe(time.perf_counter() - started_at)
+        self.stats.increment("deletes")
+
+    def start(self) -> None:
+        """Start backend background tasks."""
+
+    def stop(self) -> None:
+        """Stop backend background tasks and release resources."""
+
+    def sweep(self, batch_size: int) -> SweepReport:
+        """Delete expired entries from storage."""
+        return SweepReport(files=0, bytes=0)
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> bytes | None:
+        """Get packed entry from storage."""
+
+    @abc.abstractmethod
+    def _set(self, key: str, data: bytes, version: int, ttl: float) -> None:
+        """Atomically put packed entry to storage unless stored one has greater version."""
+
+    @abc.abstractmethod
+    def _delete(self, key: str) -> None:
+        """Delete value from storage."""
+
+
+class MemoryCache(Generic[KeyT, ValueT]):
+    """Bounded in-process LRU cache with per-entry TTL.
+
+    Limits equal to zero are disabled. The cache is local to the worker process,
+    so entries invalidated by another worker live until their TTL runs out.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        """Init cache with limits and entries time to live in seconds."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[KeyT, tuple[float, int, int, ValueT]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """Get not expired value and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, _, value = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: KeyT, value: ValueT, size: int, version: int = 0, ttl: float | None = None) -> None:
+        """Put value to cache unless cached one has greater version, evict entries over the limits."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or (self.max_bytes and size > self.max_bytes):
+            return
+        with self._lock:
+            now = time.monotonic()
+            current = self._entries.get(key)
+            if current is not None and current[2] > version and current[0] > now:
+                return
+            self._pop(key)
+            self._entries[key] = (now + ttl, size, version, value)
+            self._size += size
+            while self._is_overflowed():
+                _, (_, evicted_size, _, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def delete(self, key: KeyT) -> None:
+        """Delete value from cache."""
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        """Delete all values from cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: KeyT) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def _is_overflowed(self) -> bool:
+        too_many_entries = bool(self.max_entries) and len(self._entries) > self.max_entries
+        too_many_bytes = bool(self.max_bytes) and self._size > self.max_bytes
+        return too_many_entries or too_many_bytes
+
+
+class MemoryBackend(CacheBackend):
+    """Cache in worker process memory, not shared between workers or nodes."""
+
+    name = "memory"
+
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int) -> None:
+        """Init backend with entries limits."""
+        super().__init__(ttl)
+        self._cache: MemoryCache[str, bytes] = MemoryCache(max_entries, max_bytes, ttl or float("inf"))
+
+    def _get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    def _set(self, key: str, data: bytes, version: int, ttl: float) -> None:
+        self._cache.set(key, data, len(data), version, ttl or float("inf"))
+
+    def _delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+
+def get_cache_path(key: str | int, cache_dir: Path) -> Path:
+    """Get path to cache file in two-level sharded directory layout."""
+    digest = hashlib.sha256(str(key).encode()).hexdigest()
+    return cache_dir / digest[:2] / digest[2:4] / f"{key}.json"
+
+
+def write_file_atomically(path_to_file: Path, content: bytes) -> None:
+    """Write file via temporary file and rename, so readers never see partial content."""
+    path_to_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path_to_file.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path_to_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def migrate_flat_cache(cache_dir: Path) -> int:
+    """Move cache files from flat directory layout to sharded one, return number of moved files."""
+    moved = 0
+    for path_to_file in cache_dir.glob("*.json"):
+        if path_to_file.stem.isdigit() is False:
+            continue
+        new_path = get_cache_path(path_to_file.stem, cache_dir)
+        new_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path_to_file, new_path)
+        moved += 1
+    return moved
+
+
+def read_cache_file(path_to_file: Path, ttl: float) -> bytes | None:
+    """Read not expired cache file and mark it as recently used by its access time.
+
+    Modification time is kept as creation time of the entry for TTL checks.
+    """
+    try:
+        with open(path_to_file, "rb") as f:
+            created_at = os.fstat(f.fileno()).st_mtime
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    if ttl and created_at + ttl <= time.time():
+        return None
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(path_to_file, (time.time(), created_at))
+    return content
+
+
+class FileCacheSweeper:
+    """Background thread evicting expired and least recently used cache files.
+
+    Files are deleted in batches with a pause between them, so the sweep does not
+    compete with request handling for disk and interpreter time.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int, max_bytes: int, ttl: float) -> None:
+        """Init sweeper with cache limits, zero limits are disabled."""
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, interval: float, batch_size: int) -> None:
+        """Start sweeping in background thread every interval seconds."""
+        if self._thread is not None or interval <= 0:
+            return
+        if not (self.max_entries or self.max_bytes or self.ttl):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval, batch_size), name="cache-sweeper", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sweep(self, batch_size: int, pause: float = 0.01) -> SweepReport:
+        """Delete expired files and least recently used ones over the limits."""
+        now = time.time()
+        expired, alive = [], []
+        for path_to_file, stat in self._scan():
+            if self.ttl and stat.st_mtime + self.ttl <= now:
+                expired.append((path_to_file, stat.st_size))
+            else:
+                alive.append((stat.st_atime, path_to_file, stat.st_size))
+        return self._delete(expired + self._select_least_recently_used(alive), batch_size, pause)
+
+    def _select_least_recently_used(self, alive: list[tuple[float, Path, int]]) -> list[tuple[Path, int]]:
+        alive.sort()
+        entries_left = len(alive)
+        bytes_left = sum(size for _, _, size in alive)
+        evicted: list[tuple[Path, int]] = []
+        for _, path_to_file, size in alive:
+            too_many_entries = bool(self.max_entries) and entries_left > self.max_entries
+            too_many_bytes = bool(self.max_bytes) and bytes_left > self.max_bytes
+            if not (too_many_entries or too_many_bytes):
+                break
+            evicted.append((path_to_file, size))
+            entries_left -= 1
+            bytes_left -= size
+        return evicted
+
+    def _run(self, interval: float, batch_size: int) -> None:
+        while not self._stop_event.wait(interval):
+            try:
+                report = self.sweep(batch_size)
+            except OSError:
+                logger.exception("Cache sweep failed.")
+                continue
+            logger.info("Cache sweep reclaimed %s files, %s bytes.", report.files, report.bytes)
+
+    def _scan(self) -> Iterator[tuple[Path, os.stat_result]]:
+        for path_to_file in self.cache_dir.glob("*/*/*.json"):
+            with contextlib.suppress(FileNotFoundError):
+                yield path_to_file, path_to_file.stat()
+
+    def _delete(self, files: list[tuple[Path, int]], batch_size: int, pause: float) -> SweepReport:
+        deleted_files, deleted_bytes = 0, 0
+        for start in range(0, len(files), max(batch_size, 1)):
+            if self._stop_event.is_set():
+                break
+            for path_to_file, size in files[start:start + batch_size]:
+                with contextlib.suppress(FileNotFoundError):
+                    path_to_file.unlink()
+                    deleted_files += 1
+                    deleted_bytes += size
+            time.sleep(pause)
+        return SweepReport(files=deleted_files, bytes=deleted_bytes)
+
+
+class FileBackend(CacheBackend):
+    """Cache in JSON files on local disk, sharded into two-level directories."""
+
+    name = "file"
+
+    def __init__(  # noqa: CFQ002
+        self,
+        cache_dir: Path,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        sweep_interval: float,
+        sweep_batch_size: int,
+    ) -> None:
+        """Init backend with cache directory, limits and background sweeper settings."""
+        super().__init__(ttl)
+        self.cache_dir = cache_dir
+        self.sweep_interval = sweep_interval
+        self.sweep_batch_size = sweep_batch_size
+        self.sweeper = FileCacheSweeper(cache_dir, max_entries, max_bytes, ttl)
+
+    def get_path(self, key: str) -> Path:
+        """Get path to cache file by key."""
+        return get_cache_path(key, self.cache_dir)
+
+    def start(self) -> None:
+        """Start background sweeper."""
+        self.sweeper.start(self.sweep_interval, self.sweep_batch_size)
+
+    def stop(self) -> None:
+        """Stop background sweeper."""
+        self.sweeper.stop()
+
+    def sweep(self, batch_size: int) -> SweepReport:
+        """Delete expired and least recently used files over the limits."""
+        return self.sweeper.sweep(batch_size)
+
+    def _get(self, key: str) -> bytes | None:
+        return read_cache_file(self.get_path(key), self.ttl)
+
+    def _set(self, key: str, data: bytes, version: int, ttl: float) -> None:
+        path_to_file = self.get_path(key)
+        with file_lock(self.cache_dir / ".write-locks", key, stripes=256, timeout=1) as is_locked:
+            if is_locked is False:
+                raise CacheBackendError(f"Timeout of waiting for write lock of cache file {path_to_file}.")
+            current = read_cache_file(path_to_file, self.ttl)
+            if current is not None and unpack_entry(current).version > version:
+                return
+            write_file_atomically(path_to_file, data)
+
+    def _delete(self, key: str) -> None:
+        self.get_path(key).unlink(missing_ok=True)
+
+
+class SQLiteBackend(CacheBackend):
+    """Cache in single-file SQLite database shared by worker processes of the node."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, ttl: float) -> None:
+        """Init backend with path to database file."""
+        super().__init__(ttl)
+        self.path = path
+        self._local = threading.local()
+
+    def sweep(self, batch_size: int) -> SweepReport:
+        """Delete expired rows."""
+        cursor = self._connection().execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ? LIMIT ?)",
+            (time.time(), batch_size),
+        )
+        return SweepReport(files=cursor.rowcount, bytes=0)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, version INTEGER NOT NULL, expires_at REAL) WITHOUT ROWID",
+            )
+            self._local.connection = connection
+        return connection
+
+    def _get(self, key: str) -> bytes | None:
+        row = self._connection().execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return None
+        return row[0]
+
+    def _set(self, key: str, data: bytes, version: int, ttl: float) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        self._connection().execute(
+            "INSERT INTO cache (key, value, version, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, version = excluded.version, expires_at = excluded.expires_at "
+            "WHERE cache.version <= excluded.version OR cache.expires_at <= ?",
+            (key, data, version, expires_at, now),
+        )
+
+    def _delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+
+class RedisBackend(CacheBackend):
+    """Cache in Redis or any server speaking Redis protocol, shared between nodes.
+
+    Uses a minimal RESP client with one connection per thread.
+    """
+
+    name = "redis"
+
+    set_if_newer_script = (
+        "local current = redis.call('GET', KEYS[1]) "
+        "if current then "
+        "local version = tonumber(string.match(current, '^(%d+)[ \\n]')) "
+        "if version and version > tonumber(ARGV[2]) then return 0 end "
+        "end "
+        "if ARGV[3] == '0' then redis.call('SET', KEYS[1], ARGV[1]) "
+        "else redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[3]) end "
+        "return 1"
+    )
+
+    def __init__(self, url: str, prefix: str, ttl: float, timeout: float) -> None:
+        """Init backend with server url like `redis://:password@host:6379/0` and keys prefix."""
+        super().__init__(ttl)
+        parsed_url = urlsplit(url)
+        self.host = parsed_url.hostname or "localhost"
+        self.port = parsed_url.port or 6379
+        self.password = parsed_url.password
+        self.database = int(parsed_url.path.lstrip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def execute(self, *args: str | bytes) -> RedisReply:
+        """Execute command, reconnecting once if connection was lost."""
+        try:
+            return self._execute(*args)
+        except OSError:
+            self._disconnect()
+            return self._execute(*args)
+
+    def stop(self) -> None:
+        """Close connection of current thread."""
+        self._disconnect()
+
+    def _get(self, key: str) -> bytes | None:
+        value = self.execute("GET", self.prefix + key)
+        return value if isinstance(value, bytes) else None
+
+    def _set(self, key: str, data: bytes, version: int, ttl: float) -> None:
+        self.execute("EVAL", self.set_if_newer_script, "1", self.prefix + key, data, str(version), str(int(ttl * 1000)))
+
+    def _delete(self, key: str) -> None:
+        self.execute("DEL", self.prefix + key)
+
+    def _execute(self, *args: str | bytes) -> RedisReply:
+        sock, reader = self._connect()
+        sock.sendall(self._encode(args))
+        return self._read_reply(reader)
+
+    def _connect(self) -> tuple[socket.socket, BinaryIO]:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = (sock, sock.makefile("rb"))
+        self._local.connection = connection
+        if self.password:
+            self._execute("AUTH", self.password)
+        if self.database:
+            self._execute("SELECT", str(self.database))
+        return connection
+
+    def _disconnect(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            with contextlib.suppress(OSError):
+                connection[1].close()
+                connection[0].close()
+
+    @staticmethod
+    def _encode(args: tuple[str | bytes, ...]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            value = arg.encode() if isinstance(arg, str) else arg
+            parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+        return b"".join(parts)
+
+    def _read_reply(self, reader: BinaryIO) -> RedisReply:
+        line = reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server.")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"-":
+            raise CacheBackendError(payload.decode())
+        if kind in (b"+", b":"):
+            return payload if kind == b"+" else int(payload)
+        if kind in (b"$", b"*"):
+            return self._read_sized_reply(reader, kind, int(payload))
+        raise CacheBackendError(f"Unexpected reply from cache server: {line!r}")
+
+    def _read_sized_reply(self, reader: BinaryIO, kind: bytes, length: int) -> RedisReply:
+        if length == -1:
+            return None
+        if kind == b"$":
+            return reader.read(length + 2)[:-2]
+        return [self._read_reply(reader) for _ in range(length)]
+
+
+def create_cache_backend(config: Config) -> CacheBackend:
+    """Create cache backend selected in configurations."""
+    factories: dict[str, Callable[[], CacheBackend]] = {
+        MemoryBackend.name: lambda: MemoryBackend(
+            config.CACHE_TTL, config.CACHE_MEMORY_MAX_ENTRIES, config.CACHE_MEMORY_MAX_BYTES,
+        ),
+        FileBackend.name: lambda: FileBackend(
+            Path(config.CACHE_DIR),
+            config.CACHE_TTL,
+            config.CACHE_FILE_MAX_ENTRIES,
+            config.CACHE_FILE_MAX_BYTES,
+            config.CACHE_SWEEP_INTERVAL,
+            config.CACHE_SWEEP_BATCH_SIZE,
+        ),
+        SQLiteBackend.name: lambda: SQLiteBackend(config.CACHE_SQLITE_PATH, config.CACHE_TTL),
+        RedisBackend.name: lambda: RedisBackend(
+            config.CACHE_REDIS_URL, config.CACHE_REDIS_PREFIX, config.CACHE_TTL, config.CACHE_REDIS_TIMEOUT,
+        ),
+    }
+    if config.CACHE_BACKEND not in factories:
+        raise ValueError(f"Unknown cache backend {config.CACHE_BACKEND}.")
+    return factories[config.CACHE_BACKEND]()
@@ -3,40 +3,108 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 
+from src import metrics
+from src.cache_backends import MemoryCache, create_cache_backend
+from src.configurations import Config
+from src.locks import SingleFlight, file_lock
 from src.models import User
 from src.schemas import UserOut
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import Iterable
+
     from sqlalchemy.orm import Session
 
+    from src.cache_backends import CacheEntry
+
+
+config = Config()
+
+NOT_FOUND = b""
+
+memory_cache: MemoryCache[int, UserOut] = MemoryCache(
+    config.CACHE_MEMORY_MAX_ENTRIES, config.CACHE_MEMORY_MAX_BYTES, config.CACHE_MEMORY_TTL,
+)
+cache_backend = create_cache_backend(config)
+cache_loads: SingleFlight[UserOut] = SingleFlight()
+metrics.register_collector("cache", lambda: {"backend": cache_backend.name, **cache_backend.stats.snapshot()})
+
+
+def get_user_version(user: User) -> int:
+    """Get version of user's data as microseconds of its last update."""
+    if user.updated_ts is None:
+        return 0
+    return (user.updated_ts - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+
 
 def get_user_from_cache(user_id: int, session: Session) -> UserOut:
     """Get user's data from cache or create new cache."""
-    path_to_file = Path("cache") / f"{user_id}.json"
-    if path_to_file.exists() is False:
+    user_data = memory_cache.get(user_id)
+    if user_data is not None:
+        return user_data
+    entry = cache_backend.get(str(user_id))
+    if entry is None:
+        return cache_loads.do(user_id, lambda: load_user_cache(user_id, session))
+    return remember_user_cache(user_id, entry)
+
+
+def load_user_cache(user_id: int, session: Session) -> UserOut:
+    """Create user's cache on miss, once for all worker processes waiting for the same user."""
+    if not config.CACHE_LOCK_DIR:
         return create_user_cache(user_id, session)
-    return UserOut.parse_file(path_to_file)
+    with file_lock(Path(config.CACHE_LOCK_DIR), user_id, config.CACHE_LOCK_STRIPES, config.CACHE_LOCK_TIMEOUT):
+        entry = cache_backend.get(str(user_id))
+        if entry is None:
+            return create_user_cache(user_id, session)
+    return remember_user_cache(user_id, entry)
+
+
+def remember_user_cache(user_id: int, entry: CacheEntry) -> UserOut:
+    """Parse cache entry and keep it in memory cache."""
+    if entry.value == NOT_FOUND:
+        raise HTTPException(status_code=404, detail="User not found.")
+    user_data = UserOut.parse_raw(entry.value)
+    memory_cache.set(user_id, user_data, len(entry.value), entry.version)
+    return user_data
 
 
 def create_user_cache(user_id: int, session: Session) -> UserOut:
     """Create new user's cache."""
     user = User.get_active_by_id(session, user_id)
     if user is None:
+        if config.CACHE_NEGATIVE_TTL:
+            cache_backend.set(str(user_id), NOT_FOUND, ttl=config.CACHE_NEGATIVE_TTL)
         raise HTTPException(status_code=404, detail="User not found.")
+    return update_user_cache(user)
+
+
+def update_user_cache(user: User) -> UserOut:
+    """Write user's data to cache, unless cache already has data of a later update."""
     user_data = UserOut.from_orm(user)
-    path_to_file = Path("cache") / f"{user_id}.json"
-    with open(path_to_file, "w") as f:
-        json.dump(user_data.dict(), f)
+    content = json.dumps(user_data.dict()).encode()
+    version = get_user_version(user)
+    cache_backend.set(str(user.id), content, version)
+    memory_cache.set(user.id, user_data, len(content), version)
     return user_data
 
 
+def warm_users_cache(users: Iterable[User], executor: Executor) -> int:
+    """Write users' data to shared cache in parallel, return number of written users."""
+    entries = [
+        (str(user.id), json.dumps(UserOut.from_orm(user).dict()).encode(), get_user_version(user)) for user in users
+    ]
+    list(executor.map(lambda entry: cache_backend.set(*entry), entries))
+    return len(entries)
+
+
 def delete_user_from_cache(user_id: int) -> None:
-    """Delete user's data from cache."""
-    path_to_file = Path("cache") / f"{user_id}.json"
-    if path_to_file.exists():
-        path_to_file.unlink()
+    """Delete user's data from cache, including the mark of missing or inactive user."""
+    memory_cache.delete(user_id)
+    cache_backend.delete(str(user_id))
@@ -0,0 +1,90 @@
+"""Command line maintenance commands.
+
+Usage: `python -m src.commands <command> [options]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src import database
+from src.cache_backends import migrate_flat_cache
+from src.cash_controller import cache_backend, warm_users_cache
+from src.configurations import Config
+from src.models import User
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+config = Config()
+
+
+def migrate_cache(args: argparse.Namespace) -> None:
+    """Move flat `cache/{user_id}.json` files into sharded directory layout."""
+    moved = migrate_flat_cache(Path(args.cache_dir))
+    sys.stdout.write(f"Moved {moved} cache files.\n")
+
+
+def sweep_cache(args: argparse.Namespace) -> None:
+    """Delete expired cache entries and least recently used ones over configured limits."""
+    report = cache_backend.sweep(args.batch_size)
+    sys.stdout.write(f"Reclaimed {report.files} cache entries, {report.bytes} bytes.\n")
+
+
+def warm_cache(args: argparse.Namespace) -> None:
+    """Prefill cache with active users, most recently updated first."""
+    try:
+        warm_cache_from_database(database.session(), args.limit, args.batch_size, args.workers, args.rate)
+    finally:
+        database.session.remove()
+
+
+def warm_cache_from_database(session: Session, limit: int, batch_size: int, workers: int, rate: float) -> int:
+    """Stream active users from database and write them to cache in batches at most rate users per second."""
+    users = User.iter_active(session, limit, batch_size)
+    started_at = time.monotonic()
+    warmed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while batch := list(itertools.islice(users, batch_size)):
+            warmed += warm_users_cache(batch, executor)
+            elapsed = time.monotonic() - started_at
+            if rate > 0 and warmed / rate > elapsed:
+                time.sleep(warmed / rate - elapsed)
+                elapsed = warmed / rate
+            sys.stdout.write(f"Warmed {warmed} users, {warmed / max(elapsed, 1e-6):.0f} users/s.\n")
+    return warmed
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse command line arguments and run command."""
+    parser = argparse.ArgumentParser(prog="python -m src.commands")
+    subparsers = parser.add_subparsers(required=True)
+
+    migrate_cache_parser = subparsers.add_parser("migrate-cache", help=migrate_cache.__doc__)
+    migrate_cache_parser.add_argument("--cache-dir", default=config.CACHE_DIR)
+    migrate_cache_parser.set_defaults(handler=migrate_cache)
+
+    sweep_cache_parser = subparsers.add_parser("sweep-cache", help=sweep_cache.__doc__)
+    sweep_cache_parser.add_argument("--batch-size", type=int, default=config.CACHE_SWEEP_BATCH_SIZE)
+    sweep_cache_parser.set_defaults(handler=sweep_cache)
+
+    warm_cache_parser = subparsers.add_parser("warm-cache", help=warm_cache.__doc__)
+    warm_cache_parser.add_argument("--limit", type=int, default=0, help="Number of users, all active users by default.")
+    warm_cache_parser.add_argument("--batch-size", type=int, default=1000)
+    warm_cache_parser.add_argument("--workers", type=int, default=8)
+    warm_cache_parser.add_argument("--rate", type=float, default=0, help="Users per second, unlimited by default.")
+    warm_cache_parser.set_defaults(handler=warm_cache)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,3 +16,28 @@ class Config(BaseSettings):
     RABBITMQ_DEFAULT_PASS: str
     RABBITMQ_HOST: str
     RABBITMQ_QUEUE: str
+
+    CACHE_BACKEND: str = "file"
+    CACHE_TTL: float = 3600
+    CACHE_WRITE_THROUGH: bool = True
+    CACHE_NEGATIVE_TTL: float = 30
+
+    CACHE_DIR: str = "cache"
+    CACHE_FILE_MAX_ENTRIES: int = 0
+    CACHE_FILE_MAX_BYTES: int = 0
+    CACHE_SWEEP_INTERVAL: float = 60
+    CACHE_SWEEP_BATCH_SIZE: int = 500
+
+    CACHE_LOCK_DIR: str = "cache/.locks"
+    CACHE_LOCK_STRIPES: int = 256
+    CACHE_LOCK_TIMEOUT: float = 5
+
+    CACHE_SQLITE_PATH: str = "cache/cache.sqlite3"
+
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_REDIS_PREFIX: str = "user:"
+    CACHE_REDIS_TIMEOUT: float = 1
+
+    CACHE_MEMORY_MAX_ENTRIES: int = 10000
+    CACHE_MEMORY_MAX_BYTES: int = 0
+    CACHE_MEMORY_TTL: float = 30
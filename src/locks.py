@@ -0,0 +1,88 @@
+"""Locks for coalescing concurrent work."""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, Generic, Hashable, TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Iterator
+
+
+ResultT = TypeVar("ResultT")
+
+
+class _Call(Generic[ResultT]):
+    """Load in progress, shared by leader and waiters."""
+
+    def __init__(self) -> None:
+        """Init not finished call."""
+        self.done = threading.Event()
+        self.result: ResultT | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[ResultT]):
+    """Coalesce concurrent calls for the same key in the process.
+
+    The first caller runs the load, the others wait for it and get its result
+    or its exception.
+    """
+
+    def __init__(self) -> None:
+        """Init without calls in progress."""
+        self._calls: dict[Hashable, _Call[ResultT]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, load: Callable[[], ResultT]) -> ResultT:
+        """Run load for the key or wait for the one already in progress."""
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if is_leader is False:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = load()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+@contextlib.contextmanager
+def file_lock(lock_dir: Path, key: Hashable, stripes: int, timeout: float) -> Iterator[bool]:
+    """Hold exclusive lock shared between processes of the node for the key.
+
+    Keys are spread over a fixed number of lock files. Yields False if the lock
+    was not acquired within timeout, so the caller can proceed without it.
+    """
+    stripe = int(hashlib.sha256(str(key).encode()).hexdigest(), 16) % stripes
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_dir / f"{stripe}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        is_locked = False
+        while is_locked is False and time.monotonic() < deadline:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                is_locked = True
+            except BlockingIOError:
+                time.sleep(0.005)
+        yield is_locked
+    finally:
+        os.close(fd)
@@ -0,0 +1,61 @@
+"""Application metrics."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any, Callable
+
+
+collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_collector(name: str, collector: Callable[[], dict[str, Any]]) -> None:
+    """Register function returning metrics snapshot under the name."""
+    collectors[name] = collector
+
+
+def collect() -> dict[str, dict[str, Any]]:
+    """Collect snapshots of all registered metrics."""
+    return {name: collector() for name, collector in collectors.items()}
+
+
+class Histogram:
+    """Thread-safe histogram of durations in seconds."""
+
+    buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self) -> None:
+        """Init empty histogram."""
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Add observed value to histogram."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get histogram state with cumulative bucket counts."""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self._count, self._sum, self._max
+        cumulative, buckets = 0, {}
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            buckets[f"le_{bound}"] = cumulative
+        buckets["le_inf"] = count
+        return {
+            "count": count,
+            "sum": total,
+            "avg": total / count if count else 0.0,
+            "max": maximum,
+            "buckets": buckets,
+        }
@@ -14,6 +14,8 @@ from sqlalchemy.orm import Session, declarative_base
 from src.enums import UserRole
 
 if TYPE_CHECKING:
+    from typing import Iterator
+
     from src.schemas import CreateUserIn, UpdateUserIn
 
 
@@ -57,6 +59,14 @@ class User(Base):
         """Get active user by email if exists."""
         return session.query(User).filter(User.email == email).filter(User.is_active.is_(True)).first()
 
+    @classmethod
+    def iter_active(cls, session: Session, limit: int | None, batch_size: int) -> Iterator[User]:
+        """Stream active users, most recently updated first, through server-side cursor."""
+        query = session.query(User).filter(User.is_active.is_(True)).order_by(User.updated_ts.desc(), User.id.desc())
+        if limit:
+            query = query.limit(limit)
+        return iter(query.yield_per(batch_size))
+
     @classmethod
     def get_by_email(cls, session: Session, email: str) -> User | None:
         """Get user by email if exists."""
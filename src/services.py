@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 
-from src.cash_controller import delete_user_from_cache, get_user_from_cache
+from src.cash_controller import delete_user_from_cache, get_user_from_cache, update_user_cache
 from src.configurations import Config
 from src.enums import UserRole
 from src.models import ActivationKey, User
@@ -31,6 +31,7 @@ def create_new_user(user_data: CreateUserIn, session: Session, rabbitmq: RabbitM
     if existed_user is not None:
         raise HTTPException(status_code=400, detail=f"User with email {user_data.email} is already exists.")
     user = User.create(session, user_data)
+    delete_user_from_cache(user.id)
     uuid_key = uuid.uuid4()
     ActivationKey.match_user_key(session, user.id, uuid_key)
     message = QueueMessage(email=user.email, message=f"{config.SERVICE_HOST}/users/activate/{uuid_key}")
@@ -55,6 +56,7 @@ def activate_user(key: uuid.UUID, session: Session) -> BasicOut:
     if user is None:
         raise HTTPException(status_code=404, detail="User not found.")
     user.activate(session)
+    delete_user_from_cache(user.id)
     return BasicOut(message="User's profile is active.")
 
 
@@ -73,5 +75,7 @@ def update_user(user_id: int, user_data: UpdateUserIn, token_data: TokenData, se
     if user is None:
         raise HTTPException(status_code=404, detail="User not found.")
     updated_user = user.update(session, user_data)
+    if config.CACHE_WRITE_THROUGH:
+        return update_user_cache(updated_user)
     delete_user_from_cache(user_id)
     return UserOut.from_orm(updated_user)
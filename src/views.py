@@ -6,19 +6,42 @@ from fastapi import Depends
 
 from sqlalchemy.orm import Session
 
-from src import app, services
+from src import app, metrics, services
+from src.cash_controller import cache_backend
+from src.configurations import Config
 from src.database import get_session
 from src.rabbitmq import RabbitMQ
 from src.schemas import BasicOut, CreateUserIn, ErrorOut, LoginUserIn, LoginUserOut, TokenData, UpdateUserIn, UserOut
 from src.security import decode_token
 
 
+config = Config()
+
+
+@app.on_event("startup")
+def start_background_tasks() -> None:
+    """Start background tasks."""
+    cache_backend.start()
+
+
+@app.on_event("shutdown")
+def stop_background_tasks() -> None:
+    """Stop background tasks."""
+    cache_backend.stop()
+
+
 @app.get("/ping")
 def health_check() -> str:
     """Health check endpoint."""
     return "pong"
 
 
+@app.get("/metrics")
+def get_metrics() -> dict:
+    """Application metrics endpoint."""
+    return metrics.collect()
+
+
 @app.post("/users/sign-up", responses={200: {"model": BasicOut}, 400: {"model": ErrorOut}})
 def create_new_user(
     user_data: CreateUserIn, session: Session = Depends(get_session), rabbitmq: RabbitMQ = Depends(RabbitMQ),
@@ -7,6 +7,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+from src.cash_controller import memory_cache
 from src.configurations import Config
 from src.database import get_session
 from src.views import app
@@ -48,4 +49,5 @@ def client(db_empty):
     def override_get_session():
         yield db_empty
     app.dependency_overrides[get_session] = override_get_session
+    memory_cache.clear()
     return TestClient(app)
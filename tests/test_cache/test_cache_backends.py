@@ -0,0 +1,156 @@
+import io
+import os
+import time
+
+import pytest
+
+from src.cache_backends import (
+    CacheEntry, FileBackend, FileCacheSweeper, MemoryBackend, RedisBackend, SQLiteBackend, SweepReport,
+    get_cache_path, migrate_flat_cache, read_cache_file, unpack_entry, write_file_atomically,
+)
+
+
+@pytest.fixture
+def memory_backend():
+    return MemoryBackend(ttl=60, max_entries=10, max_bytes=0)
+
+
+@pytest.fixture
+def file_backend(tmp_path):
+    return FileBackend(tmp_path, ttl=60, max_entries=0, max_bytes=0, sweep_interval=0, sweep_batch_size=10)
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / "cache.sqlite3"), ttl=60)
+
+
+@pytest.mark.parametrize("backend_fixture", ["memory_backend", "file_backend", "sqlite_backend"])
+def test_cache_backend_stores_and_deletes_values(request, backend_fixture):
+    backend = request.getfixturevalue(backend_fixture)
+
+    assert backend.get("1") is None
+    backend.set("1", b'{"id": 1}', version=1)
+    assert backend.get("1")[:2] == (1, b'{"id": 1}')
+    backend.delete("1")
+    assert backend.get("1") is None
+
+    stats = backend.stats.snapshot()
+    assert (stats["hits"], stats["misses"], stats["sets"], stats["deletes"]) == (1, 2, 1, 1)
+    assert stats["get_latency"]["count"] == 3
+
+
+@pytest.mark.parametrize("backend_fixture", ["memory_backend", "file_backend", "sqlite_backend"])
+def test_cache_backend_does_not_overwrite_entry_with_greater_version(request, backend_fixture):
+    backend = request.getfixturevalue(backend_fixture)
+
+    backend.set("1", b'{"first_name": "new"}', version=2)
+    backend.set("1", b'{"first_name": "old"}', version=1)
+    assert backend.get("1")[:2] == (2, b'{"first_name": "new"}')
+    backend.set("1", b'{"first_name": "newest"}', version=3)
+    assert backend.get("1")[:2] == (3, b'{"first_name": "newest"}')
+
+
+@pytest.mark.parametrize("backend_fixture", ["memory_backend", "file_backend", "sqlite_backend"])
+def test_cache_backend_expires_entry_by_its_own_ttl(request, backend_fixture):
+    backend = request.getfixturevalue(backend_fixture)
+
+    backend.set("1", b"", ttl=0.01)
+    assert backend.get("1") == CacheEntry(version=0, value=b"", expires_at=pytest.approx(time.time(), abs=1))
+    time.sleep(0.02)
+
+    assert backend.get("1") is None
+
+
+def test_unpack_entry_reads_entry_without_version_line():
+    assert unpack_entry(b'{"id": 1}') == CacheEntry(version=0, value=b'{"id": 1}')
+
+
+def test_sqlite_backend_does_not_return_expired_values(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"), ttl=0.01)
+    backend.set("1", b"{}")
+    time.sleep(0.02)
+
+    assert backend.get("1") is None
+    assert backend.sweep(batch_size=10).files == 1
+
+
+def test_redis_backend_encodes_commands_and_parses_replies():
+    backend = RedisBackend("redis://localhost:6379/0", prefix="user:", ttl=60, timeout=1)
+
+    assert backend._encode(("GET", b"user:1")) == b"*2\r\n$3\r\nGET\r\n$6\r\nuser:1\r\n"
+    assert backend._read_reply(io.BytesIO(b"$2\r\n{}\r\n")) == b"{}"
+    assert backend._read_reply(io.BytesIO(b"$-1\r\n")) is None
+    assert backend._read_reply(io.BytesIO(b"*2\r\n:1\r\n+OK\r\n")) == [1, b"OK"]
+
+
+def test_get_cache_path_returns_two_level_sharded_path(tmp_path):
+    path_to_file = get_cache_path(2, tmp_path)
+
+    assert path_to_file.name == "2.json"
+    assert path_to_file.parent.parent.parent == tmp_path
+    assert len(path_to_file.parent.name) == 2
+    assert len(path_to_file.parent.parent.name) == 2
+
+
+def test_write_file_atomically_leaves_no_temporary_files(tmp_path):
+    path_to_file = get_cache_path(2, tmp_path)
+
+    write_file_atomically(path_to_file, b"{}")
+    write_file_atomically(path_to_file, b'{"id": 2}')
+
+    assert path_to_file.read_bytes() == b'{"id": 2}'
+    assert list(path_to_file.parent.iterdir()) == [path_to_file]
+
+
+def test_migrate_flat_cache_moves_user_files_to_sharded_layout(tmp_path):
+    (tmp_path / "1.json").write_bytes(b'{"id": 1}')
+    (tmp_path / "2.json").write_bytes(b'{"id": 2}')
+    (tmp_path / "example.json").write_bytes(b"{}")
+
+    moved = migrate_flat_cache(tmp_path)
+
+    assert moved == 2
+    assert get_cache_path(1, tmp_path).read_bytes() == b'{"id": 1}'
+    assert get_cache_path(2, tmp_path).read_bytes() == b'{"id": 2}'
+    assert (tmp_path / "1.json").exists() is False
+    assert (tmp_path / "example.json").exists()
+
+
+def test_file_cache_sweeper_deletes_expired_files(tmp_path):
+    sweeper = FileCacheSweeper(tmp_path, max_entries=0, max_bytes=0, ttl=60)
+    expired_path, fresh_path = get_cache_path(1, tmp_path), get_cache_path(2, tmp_path)
+    write_file_atomically(expired_path, b"{}")
+    write_file_atomically(fresh_path, b"{}")
+    os.utime(expired_path, (time.time(), time.time() - 120))
+
+    report = sweeper.sweep(batch_size=1, pause=0)
+
+    assert report == SweepReport(files=1, bytes=2)
+    assert expired_path.exists() is False
+    assert fresh_path.exists()
+
+
+def test_file_cache_sweeper_evicts_least_recently_used_files_over_limit(tmp_path):
+    sweeper = FileCacheSweeper(tmp_path, max_entries=2, max_bytes=0, ttl=0)
+    for user_id in range(1, 4):
+        write_file_atomically(get_cache_path(user_id, tmp_path), b"{}")
+    now = time.time()
+    os.utime(get_cache_path(1, tmp_path), (now - 10, now))
+    os.utime(get_cache_path(2, tmp_path), (now - 30, now))
+    os.utime(get_cache_path(3, tmp_path), (now - 20, now))
+
+    report = sweeper.sweep(batch_size=10, pause=0)
+
+    assert report.files == 1
+    assert get_cache_path(2, tmp_path).exists() is False
+    assert get_cache_path(1, tmp_path).exists()
+    assert get_cache_path(3, tmp_path).exists()
+
+
+def test_read_cache_file_ignores_expired_file(tmp_path):
+    path_to_file = get_cache_path(1, tmp_path)
+    write_file_atomically(path_to_file, b"{}")
+    os.utime(path_to_file, (time.time(), time.time() - 61))
+
+    assert read_cache_file(path_to_file, ttl=60) is None
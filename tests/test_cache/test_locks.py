@@ -0,0 +1,58 @@
+import threading
+import time
+
+from src.locks import SingleFlight, file_lock
+
+
+def test_single_flight_runs_one_load_for_concurrent_calls():
+    single_flight = SingleFlight()
+    loads = []
+    results = []
+
+    def load():
+        loads.append(1)
+        time.sleep(0.05)
+        return "user"
+
+    threads = [threading.Thread(target=lambda: results.append(single_flight.do(1, load))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert results == ["user"] * 10
+
+
+def test_single_flight_shares_error_with_waiters_and_forgets_it():
+    single_flight = SingleFlight()
+    errors = []
+
+    def load():
+        time.sleep(0.05)
+        raise ValueError("User not found.")
+
+    def call():
+        try:
+            single_flight.do(1, load)
+        except ValueError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert single_flight.do(1, lambda: "user") == "user"
+
+
+def test_file_lock_is_not_acquired_while_held_by_other_holder(tmp_path):
+    with file_lock(tmp_path, 1, stripes=1, timeout=1) as is_locked:
+        assert is_locked
+        with file_lock(tmp_path, 2, stripes=1, timeout=0.05) as is_locked_again:
+            assert is_locked_again is False
+
+    with file_lock(tmp_path, 2, stripes=1, timeout=0.05) as is_locked:
+        assert is_locked
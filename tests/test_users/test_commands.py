@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from src import cash_controller
+from src.cache_backends import get_cache_path, unpack_entry
+from src.commands import warm_cache_from_database
+from src.configurations import Config
+from src.schemas import UserOut
+
+
+config = Config()
+
+
+@pytest.mark.fixtures({"db": "db_with_admin_and_regular_users"})
+def test_warm_cache_from_database_writes_active_users_to_cache(fixtures, capsys):
+    warmed = warm_cache_from_database(fixtures.db, limit=0, batch_size=1, workers=2, rate=0)
+
+    assert warmed == 2
+    assert capsys.readouterr().out.startswith("Warmed 1 users")
+    for user_id in (1, 2):
+        path_to_file = get_cache_path(user_id, Path(config.CACHE_DIR))
+        assert UserOut.parse_raw(unpack_entry(path_to_file.read_bytes()).value).id == user_id
+        cash_controller.delete_user_from_cache(user_id)
+
+
+@pytest.mark.fixtures({"db": "db_with_admin_and_regular_users"})
+def test_warm_cache_from_database_writes_limited_number_of_users(fixtures):
+    warmed = warm_cache_from_database(fixtures.db, limit=1, batch_size=10, workers=1, rate=0)
+
+    assert warmed == 1
+    cash_controller.delete_user_from_cache(1)
+    cash_controller.delete_user_from_cache(2)
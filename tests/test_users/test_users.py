@@ -1,4 +1,6 @@
 import hashlib
+import threading
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +9,8 @@ import jwt
 
 import pytest
 
+from src import cash_controller
+from src.cache_backends import get_cache_path, unpack_entry
 from src.configurations import Config
 from src.enums import UserRole
 from src.models import ActivationKey, User
@@ -212,6 +216,7 @@ def test_get_user_by_admin_user_not_found_returns_404(fixtures):
 
     assert result.status_code == 404
     assert result.json()["detail"] == "User not found."
+    cash_controller.delete_user_from_cache(3)
 
 
 @pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "admin_token"})
@@ -225,9 +230,9 @@ def test_get_user_by_admin_user_returns_correct_response(fixtures):
     assert result_json["first_name"] == "str2"
     assert result_json["role"] == UserRole.regular.value
     assert result_json["second_name"] == "str2"
-    path_to_file = Path("cache") / "2.json"
+    path_to_file = get_cache_path(2, Path(config.CACHE_DIR))
     assert path_to_file.exists()
-    assert result_json == UserOut.parse_file(path_to_file).dict()
+    assert result_json == UserOut.parse_raw(unpack_entry(path_to_file.read_bytes()).value).dict()
     path_to_file.unlink()
 
 
@@ -242,7 +247,7 @@ def test_get_user_by_regular_user_returns_correct_response(fixtures):
     assert result_json["first_name"] == "str2"
     assert result_json["role"] == UserRole.regular.value
     assert result_json["second_name"] == "str2"
-    path_to_file = Path("cache") / "2.json"
+    path_to_file = get_cache_path(2, Path(config.CACHE_DIR))
     assert path_to_file.exists()
     path_to_file.unlink()
 
@@ -262,3 +267,106 @@ def test_update_user_returns_correct_response(fixtures):
     assert result_json["first_name"] == "strstr"
     assert result_json["role"] == UserRole.regular.value
     assert result_json["second_name"] == "str2"
+    get_cache_path(2, Path(config.CACHE_DIR)).unlink()
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "regular_token"})
+def test_get_user_serves_profile_from_memory_cache(fixtures):
+    fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+    path_to_file = get_cache_path(2, Path(config.CACHE_DIR))
+    path_to_file.unlink()
+
+    result = fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+
+    assert result.status_code == 200
+    assert result.json()["email"] == "str2"
+    assert path_to_file.exists() is False
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "regular_token"})
+def test_update_user_refreshes_cache(fixtures):
+    fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+    fixtures.client.patch(
+        "/users/2", headers={"Authorization": f"Bearer {fixtures.token}"}, json={"first_name": "strstr"},
+    )
+
+    result = fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+
+    assert result.status_code == 200
+    assert result.json()["first_name"] == "strstr"
+    path_to_file = get_cache_path(2, Path(config.CACHE_DIR))
+    assert UserOut.parse_raw(unpack_entry(path_to_file.read_bytes()).value).first_name == "strstr"
+    path_to_file.unlink()
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "regular_token"})
+def test_update_user_cache_is_not_overwritten_by_stale_read(fixtures):
+    user = fixtures.db.query(User).get(2)
+    stale_user = User(id=2, email="str2", first_name="str2", role=UserRole.regular, second_name="str2")
+    stale_user.updated_ts = user.updated_ts
+    fixtures.client.patch(
+        "/users/2", headers={"Authorization": f"Bearer {fixtures.token}"}, json={"first_name": "strstr"},
+    )
+
+    cash_controller.update_user_cache(stale_user)
+
+    result = fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+    assert result.json()["first_name"] == "strstr"
+    cash_controller.memory_cache.clear()
+    result = fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"})
+    assert result.json()["first_name"] == "strstr"
+    get_cache_path(2, Path(config.CACHE_DIR)).unlink()
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "admin_token"})
+def test_get_user_coalesces_concurrent_cache_misses(fixtures, monkeypatch):
+    loads = []
+    create_user_cache = cash_controller.create_user_cache
+
+    def slow_create_user_cache(user_id, session):
+        loads.append(user_id)
+        time.sleep(0.1)
+        return create_user_cache(user_id, session)
+
+    monkeypatch.setattr(cash_controller, "create_user_cache", slow_create_user_cache)
+    responses = []
+
+    def get_user():
+        responses.append(fixtures.client.get("/users/2", headers={"Authorization": f"Bearer {fixtures.token}"}))
+
+    threads = [threading.Thread(target=get_user) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == [2]
+    assert [response.status_code for response in responses] == [200] * 5
+    cash_controller.delete_user_from_cache(2)
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_admin_and_regular_users", "token": "admin_token"})
+def test_get_user_caches_missing_user(fixtures, monkeypatch):
+    fixtures.client.get("/users/3", headers={"Authorization": f"Bearer {fixtures.token}"})
+    queries = []
+    monkeypatch.setattr(User, "get_active_by_id", lambda session, user_id: queries.append(user_id))
+
+    result = fixtures.client.get("/users/3", headers={"Authorization": f"Bearer {fixtures.token}"})
+
+    assert result.status_code == 404
+    assert result.json()["detail"] == "User not found."
+    assert queries == []
+    cash_controller.delete_user_from_cache(3)
+
+
+@pytest.mark.fixtures({"client": "client", "db": "db_with_activation_key", "token": "admin_token"})
+def test_activate_user_invalidates_cached_inactive_user(fixtures):
+    result = fixtures.client.get("/users/1", headers={"Authorization": f"Bearer {fixtures.token}"})
+    assert result.status_code == 404
+
+    fixtures.client.get("/users/activate/da7adade-dccd-4fa1-b37e-dd768310178e")
+
+    result = fixtures.client.get("/users/1", headers={"Authorization": f"Bearer {fixtures.token}"})
+    assert result.status_code == 200
+    assert result.json()["id"] == 1
+    cash_controller.delete_user_from_cache(1)